@@ -2,11 +2,42 @@
 
 import sys
 import json
+import mmap
 import os
 import csv
 import numpy as np
-from statistics import mean, stdev
-from datetime import datetime
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the stdlib json parser is used when unavailable
+    orjson = None
+
+try:
+    from tdigest import TDigest
+except ImportError:
+    # tdigest is optional; without it percentiles need the full CSV and
+    # compute_summary falls back to re-reading it each batch
+    TDigest = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+# Metric columns, in CSV order (after sample_id and timestamp). Also the
+# column order of the metrics arrays passed between parse_logs and
+# append_to_csv.
+_METRICS = (
+    "fps", "frames_received", "frames_decoded", "frames_dropped",
+    "decode_time", "bitrate_received", "round_trip_time",
+    "frames_received_per_second", "frames_decoded_per_second"
+)
 
 def eprint(*args, **kwargs):
     """Print to stderr for debugging without breaking JSON output to stdout."""
@@ -34,360 +65,572 @@ def get_output_paths(session_folder=None):
     else:
         return "webrtc_data.csv", "webrtc_summary.json"
 
+def _parse_timestamps(ts_list):
+    """
+    Bulk-parse ISO timestamp strings into a datetime64[ns] array.
+    Unparseable entries become NaT (so their time-based metrics are skipped,
+    matching the old per-entry try/except behavior).
+    """
+    stripped = [t[:-1] if t.endswith('Z') else t for t in ts_list]
+    try:
+        return np.array(stripped, dtype='datetime64[ns]')
+    except ValueError:
+        # At least one bad timestamp; fall back to element-wise parsing
+        out = np.full(len(stripped), np.datetime64('NaT'), dtype='datetime64[ns]')
+        for i, t in enumerate(stripped):
+            try:
+                out[i] = np.datetime64(t)
+            except ValueError:
+                pass
+        return out
+
+@njit(cache=True)
+def _merge_dedup(codes, metrics, n_unique):
+    """
+    Merge duplicate-timestamp rows. `codes` maps each row to its dense
+    timestamp code; the first row for a code is stored as-is and later rows
+    overwrite only the fields they actually report (non-zero values).
+    """
+    out = np.zeros((n_unique, metrics.shape[1]))
+    seen = np.zeros(n_unique, dtype=np.bool_)
+    for i in range(codes.shape[0]):
+        c = codes[i]
+        if not seen[c]:
+            seen[c] = True
+            for j in range(metrics.shape[1]):
+                out[c, j] = metrics[i, j]
+        else:
+            for j in range(metrics.shape[1]):
+                v = metrics[i, j]
+                if v != 0.0 and v != out[c, j]:
+                    out[c, j] = v
+    return out
+
+def _to_float_array(values):
+    """
+    Cast a list of raw stat values to float64 in one pass. Missing values
+    (None) become NaN; if a malformed dump sneaks a non-numeric value in,
+    fall back to element-wise coercion instead of dropping the batch.
+    """
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        out = np.full(len(values), np.nan)
+        for i, v in enumerate(values):
+            if isinstance(v, (int, float)):
+                out[i] = v
+        return out
+
+def _forward_fill(values):
+    """Forward-fill NaNs with the last preceding non-NaN value (NaN if none)."""
+    idx = np.where(~np.isnan(values), np.arange(len(values)), 0)
+    np.maximum.accumulate(idx, out=idx)
+    return values[idx]
+
 def parse_logs(data_list):
     """
     Parse WebRTC log entries and extract relevant metrics.
     Only processes the current batch of logs (incremental processing).
-    
-    Returns a deduplicated list of data rows from the current batch only.
+
+    Returns the deduplicated data from the current batch as columns:
+    a list of timestamp strings plus an (N, 9) float64 metrics array
+    (fps, frames_received, frames_decoded, frames_dropped, decode_time,
+    bitrate_received, round_trip_time, frames_received_per_second,
+    frames_decoded_per_second).
     """
-    # Track timestamps within this batch to prevent duplication
+    # Track timestamps within this batch (timestamp -> dense row code)
+    # to prevent duplication
     timestamp_data = {}
-    
-    # Keep track of previous values for calculations
-    prev_bytes = None
-    prev_frames_received = None
-    prev_frames_decoded = None
-    prev_time = None
-
-    # Sort by timestamp to ensure calculations are accurate
-    sorted_data = sorted(data_list, key=lambda e: e.get("timestamp", ""))
 
-    for entry in sorted_data:
+    # Single extraction pass: pull the raw stat fields into parallel lists,
+    # using NaN as the "not reported" sentinel. All the derived metrics
+    # (time deltas, bitrate, per-second rates) are then computed as array
+    # operations instead of per-entry datetime arithmetic.
+    ts_list = []
+    fps_l = []
+    fr_l = []
+    fd_l = []
+    drop_l = []
+    tdt_l = []
+    bytes_l = []
+    rtt_l = []
+    has_video_l = []
+
+    for entry in data_list:
         ts = entry.get("timestamp", "")
-        raw_stats = entry.get("rawStats", {})
 
         # Skip entries with no timestamp
         if not ts:
             continue
 
-        # We'll collect data in local variables
-        fps = None
-        frames_received = None
-        frames_decoded = None
-        frames_dropped = None
-        decode_time = None
-        bitrate_received = None
-        round_trip_time = None
-        frames_received_per_second = None
-        frames_decoded_per_second = None
-
-        # Parse the timestamp for time calculations
-        try:
-            current_time = None
-            if ts:
-                from datetime import datetime
-                current_time = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-        except Exception:
-            # If we can't parse the timestamp, we'll skip the time-based calculations
-            current_time = None
-
-        # Identify inbound-rtp for video and candidate-pair
-        for stat_id, stat_obj in raw_stats.items():
+        raw_stats = entry.get("rawStats", {})
+        fps = frames_received = frames_decoded = frames_dropped = None
+        total_decode_time = bytes_received = round_trip_time = None
+        has_video = False
+
+        # Identify inbound-rtp for video and candidate-pair. Values are
+        # stored raw here; the bulk float64 cast below does the type
+        # checking for the whole column at once.
+        for stat_obj in raw_stats.values():
             stype = stat_obj.get("type")
-            kind = stat_obj.get("kind")
 
             # inbound-rtp => gather video info
-            if stype == "inbound-rtp" and kind == "video":
-                # fps
-                fps_val = stat_obj.get("framesPerSecond")
-                if isinstance(fps_val, (int, float)):
-                    fps = float(fps_val)
-
-                # framesReceived
-                fr_val = stat_obj.get("framesReceived")
-                if isinstance(fr_val, int):
-                    frames_received = fr_val
-                    
-                    # Calculate frames received per second if we have previous data
-                    if prev_frames_received is not None and prev_time is not None and current_time is not None:
-                        time_diff_seconds = (current_time - prev_time).total_seconds()
-                        if time_diff_seconds > 0:
-                            frames_diff = frames_received - prev_frames_received
-                            if frames_diff >= 0:  # Ensure positive difference
-                                frames_received_per_second = frames_diff / time_diff_seconds
-
-                # framesDecoded
-                fd_val = stat_obj.get("framesDecoded")
-                if isinstance(fd_val, int):
-                    frames_decoded = fd_val
-                    
-                    # Calculate frames decoded per second if we have previous data
-                    if prev_frames_decoded is not None and prev_time is not None and current_time is not None:
-                        time_diff_seconds = (current_time - prev_time).total_seconds()
-                        if time_diff_seconds > 0:
-                            frames_diff = frames_decoded - prev_frames_decoded
-                            if frames_diff >= 0:  # Ensure positive difference
-                                frames_decoded_per_second = frames_diff / time_diff_seconds
-
-                # framesDropped
-                drop_val = stat_obj.get("framesDropped")
-                if isinstance(drop_val, int):
-                    frames_dropped = drop_val
-
-                # decode_time = totalDecodeTime / framesDecoded (simple average)
-                tdt = stat_obj.get("totalDecodeTime")
-                if (isinstance(tdt, (int, float)) and
-                    isinstance(frames_decoded, int) and
-                    frames_decoded > 0):
-                    decode_time = float(tdt) / float(frames_decoded)
-
-                # simplistic "bitrate_received" from bytesReceived
-                # ignoring actual time deltas
-                b_recv = stat_obj.get("bytesReceived")
-                if isinstance(b_recv, int):
-                    # If we have a prev_bytes, compute a difference
-                    if prev_bytes is not None and current_time is not None and prev_time is not None:
-                        time_diff_seconds = (current_time - prev_time).total_seconds()
-                        if time_diff_seconds > 0:
-                            delta_bytes = b_recv - prev_bytes
-                            if delta_bytes < 0:
-                                delta_bytes = 0  # guard in case it resets
-                            # convert to Mbit/s based on actual time difference
-                            bitrate_received = (delta_bytes * 8) / (time_diff_seconds * 1_000_000.0)  # Mbit/s
-                    prev_bytes = b_recv
-
-                # Update previous values for next calculation
-                prev_frames_received = frames_received
-                prev_frames_decoded = frames_decoded
-                prev_time = current_time
+            if stype == "inbound-rtp" and stat_obj.get("kind") == "video":
+                has_video = True
+                fps = stat_obj.get("framesPerSecond", fps)
+                frames_received = stat_obj.get("framesReceived", frames_received)
+                frames_decoded = stat_obj.get("framesDecoded", frames_decoded)
+                frames_dropped = stat_obj.get("framesDropped", frames_dropped)
+                total_decode_time = stat_obj.get("totalDecodeTime", total_decode_time)
+                bytes_received = stat_obj.get("bytesReceived", bytes_received)
 
             # candidate-pair => gather round_trip_time
             if stype == "candidate-pair":
-                crrt = stat_obj.get("currentRoundTripTime")
-                if isinstance(crrt, (int, float)):
-                    # convert s => ms
-                    round_trip_time = crrt * 1000.0
-
-        # Build a row dict - use 0 for missing values
-        row = {
-            "timestamp": ts,
-            "fps": fps if fps is not None else 0,
-            "frames_received": frames_received if frames_received is not None else 0,
-            "frames_decoded": frames_decoded if frames_decoded is not None else 0,
-            "frames_dropped": frames_dropped if frames_dropped is not None else 0,
-            "decode_time": decode_time if decode_time is not None else 0,
-            "bitrate_received": bitrate_received if bitrate_received is not None else 0,
-            "round_trip_time": round_trip_time if round_trip_time is not None else 0,
-            "frames_received_per_second": frames_received_per_second if frames_received_per_second is not None else 0,
-            "frames_decoded_per_second": frames_decoded_per_second if frames_decoded_per_second is not None else 0
-        }
-        
-        # Deduplicate within this batch
-        if ts in timestamp_data:
-            # Check if this row has any different (non-zero) values compared to the stored one
-            existing_row = timestamp_data[ts]
-            has_new_data = False
-            
-            # Check if any metric is non-zero and different from existing data
-            for metric in ["fps", "frames_received", "frames_decoded", "frames_dropped", 
-                          "decode_time", "bitrate_received", "round_trip_time",
-                          "frames_received_per_second", "frames_decoded_per_second"]:
-                if row[metric] != 0 and row[metric] != existing_row[metric]:
-                    has_new_data = True
-                    break
-            
-            if has_new_data:
-                # Update the stored data with this new information
-                for metric in ["fps", "frames_received", "frames_decoded", "frames_dropped", 
-                              "decode_time", "bitrate_received", "round_trip_time",
-                              "frames_received_per_second", "frames_decoded_per_second"]:
-                    if row[metric] != 0:
-                        existing_row[metric] = row[metric]
-        else:
-            # This is a new timestamp within this batch, store it
-            timestamp_data[ts] = row
-    
-    # Convert the deduplicated timestamp data to rows
-    rows = list(timestamp_data.values())
-    
+                round_trip_time = stat_obj.get("currentRoundTripTime", round_trip_time)
+
+        ts_list.append(ts)
+        fps_l.append(fps)
+        fr_l.append(frames_received)
+        fd_l.append(frames_decoded)
+        drop_l.append(frames_dropped)
+        tdt_l.append(total_decode_time)
+        bytes_l.append(bytes_received)
+        rtt_l.append(round_trip_time)
+        has_video_l.append(has_video)
+
+    n = len(ts_list)
+    if n == 0:
+        return [], np.empty((0, 9))
+
+    # Sort by timestamp to ensure calculations are accurate. A stable
+    # argsort over the extracted timestamp array runs in C, replacing the
+    # Python-level sorted() comparator over the raw entries.
+    order = np.argsort(np.asarray(ts_list), kind='stable')
+    ts_list = [ts_list[k] for k in order]
+
+    fps_a = _to_float_array(fps_l)[order]
+    fr_a = _to_float_array(fr_l)[order]
+    fd_a = _to_float_array(fd_l)[order]
+    drop_a = _to_float_array(drop_l)[order]
+    tdt_a = _to_float_array(tdt_l)[order]
+    bytes_a = _to_float_array(bytes_l)[order]
+    rtt_a = _to_float_array(rtt_l)[order] * 1000.0  # convert s => ms
+    has_video_a = np.array(has_video_l)[order]
+
+    # Timestamps as float seconds (NaN where unparseable)
+    parsed = _parse_timestamps(ts_list)
+    t_sec = parsed.astype('int64').astype(np.float64) / 1e9
+    t_sec[np.isnat(parsed)] = np.nan
+
+    # decode_time = totalDecodeTime / framesDecoded (simple average)
+    decode_a = np.full(n, np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        dec_mask = fd_a > 0
+        decode_a[dec_mask] = tdt_a[dec_mask] / fd_a[dec_mask]
+
+    # The prev_* chains only advance on entries carrying an inbound-rtp
+    # video stat, so the deltas are taken along that subsequence.
+    frps_a = np.full(n, np.nan)
+    fdps_a = np.full(n, np.nan)
+    bitrate_a = np.full(n, np.nan)
+    vidx = np.flatnonzero(has_video_a)
+    if len(vidx) > 1:
+        tv = t_sec[vidx]
+        dt = np.full(len(vidx), np.nan)
+        dt[1:] = tv[1:] - tv[:-1]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # frames received/decoded per second: needs both endpoints
+            # reported and a positive, non-negative-delta interval
+            for src, dst in ((fr_a, frps_a), (fd_a, fdps_a)):
+                sv = src[vidx]
+                diff = np.full(len(vidx), np.nan)
+                diff[1:] = sv[1:] - sv[:-1]
+                ok = (dt > 0) & (diff >= 0)
+                dst[vidx[ok]] = diff[ok] / dt[ok]
+
+            # bitrate: bytesReceived carries over entries that omit it,
+            # but the time delta is always since the previous video entry
+            bv = bytes_a[vidx]
+            prev_b = np.full(len(vidx), np.nan)
+            prev_b[1:] = _forward_fill(bv)[:-1]
+            delta_bytes = np.clip(bv - prev_b, 0, None)  # guard in case it resets
+            ok = (dt > 0) & ~np.isnan(bv) & ~np.isnan(prev_b)
+            # convert to Mbit/s based on actual time difference
+            bitrate_a[vidx[ok]] = (delta_bytes[ok] * 8) / (dt[ok] * 1_000_000.0)
+
+    # Missing values become 0 in the emitted rows
+    metrics = np.nan_to_num(
+        np.column_stack([fps_a, fr_a, fd_a, drop_a, decode_a,
+                         bitrate_a, rtt_a, frps_a, fdps_a]))
+
+    # Deduplicate within this batch: assign each timestamp a dense code
+    # (first-seen order) and let the JIT kernel fold duplicate rows together
+    codes = np.empty(n, dtype=np.int64)
+    uniq_ts = []
+    for i, ts in enumerate(ts_list):
+        c = timestamp_data.get(ts)
+        if c is None:
+            c = len(uniq_ts)
+            timestamp_data[ts] = c
+            uniq_ts.append(ts)
+        codes[i] = c
+
+    merged = _merge_dedup(codes, metrics, len(uniq_ts))
+
     # Sort rows by timestamp for consistency
-    rows.sort(key=lambda x: x["timestamp"])
-    
-    return rows
+    order = np.argsort(np.asarray(uniq_ts), kind='stable')
+    return [uniq_ts[k] for k in order], merged[order]
+
+def _ts_index_path(csv_filename):
+    """Sidecar file listing the timestamps already written to the CSV."""
+    return csv_filename + ".tsindex"
+
+def _running_stats_path(csv_filename):
+    """Sidecar file holding the incrementally maintained session statistics."""
+    return csv_filename + ".running.json"
+
+def _load_running_stats(csv_filename):
+    """Load the running-stats sidecar; None if missing or unreadable."""
+    path = _running_stats_path(csv_filename)
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (ValueError, OSError):
+        return None
+
+def _update_running_stats(csv_filename, timestamps, metrics_arr):
+    """
+    Fold a freshly appended batch into the persisted running statistics:
+    count/sum/sum_sq/min/max per metric (mean and std are recovered from
+    these in compute_summary) plus a t-digest per metric for percentiles.
+    This keeps the per-batch summary cost O(batch) instead of O(session).
+    No-op when tdigest is not installed.
+    """
+    if TDigest is None or len(timestamps) == 0:
+        return
+
+    # Fold the CSV representation of the batch - the same %.2f rendering
+    # the writer uses (np.round half-even disagrees with it on edge
+    # values) - so the non-zero filter and the statistics agree with what
+    # a full re-read of the file would produce
+    metrics_arr = np.char.mod('%.2f', metrics_arr).astype(np.float64)
+
+    running = _load_running_stats(csv_filename)
+    if running is None:
+        running = {
+            "num_samples": 0,
+            "first_timestamp": None,
+            "latest_timestamp": None,
+            "metrics": {}
+        }
+
+    running["num_samples"] += len(timestamps)
+    if running["first_timestamp"] is None:
+        running["first_timestamp"] = timestamps[0]
+    running["latest_timestamp"] = timestamps[-1]
+
+    for j, name in enumerate(_METRICS):
+        col = metrics_arr[:, j]
+        values = col[col > 0]
+        if len(values) == 0:
+            continue
+
+        m = running["metrics"].setdefault(name, {
+            "count": 0, "sum": 0.0, "sum_sq": 0.0,
+            "min": None, "max": None, "digest": None
+        })
+        m["count"] += int(len(values))
+        m["sum"] += float(values.sum())
+        m["sum_sq"] += float(np.square(values).sum())
+        lo, hi = float(values.min()), float(values.max())
+        m["min"] = lo if m["min"] is None else min(m["min"], lo)
+        m["max"] = hi if m["max"] is None else max(m["max"], hi)
+
+        digest = TDigest()
+        if m["digest"]:
+            digest.update_from_dict(m["digest"])
+        digest.batch_update(values)
+        m["digest"] = digest.to_dict()
+
+    with open(_running_stats_path(csv_filename), 'w', encoding='utf-8') as f:
+        json.dump(running, f)
+
+def _seed_running_stats(csv_filename):
+    """
+    Build the running-stats sidecar from an existing CSV, for sessions
+    that were started before the sidecar existed.
+    """
+    columns = read_all_csv_data(csv_filename)
+    timestamps = columns.get("timestamp", [])
+    if len(timestamps) == 0:
+        return
+    arr = np.column_stack([columns[name] for name in _METRICS])
+    _update_running_stats(csv_filename, list(timestamps), arr)
 
 def load_existing_csv(csv_filename):
     """
-    Reads existing CSV (if any), returns the number of rows found.
-    Also returns a set of timestamps that are already in the CSV.
+    Returns the number of rows already in the CSV and the set of timestamps
+    they cover. Uses the sidecar .tsindex file (one timestamp per line)
+    when present, so steady-state batches don't re-parse the whole CSV;
+    sessions started before the index existed fall back to a full scan
+    and the index is rebuilt for the next batch.
     """
     if not os.path.isfile(csv_filename):
         return 0, set()
 
-    existing_timestamps = set()
+    index_filename = _ts_index_path(csv_filename)
+    if os.path.isfile(index_filename):
+        with open(index_filename, 'r', encoding='utf-8') as f:
+            timestamps = f.read().splitlines()
+        return len(timestamps), set(timestamps)
+
+    timestamps = []
     with open(csv_filename, 'r', newline='', encoding='utf-8') as f:
         reader = csv.DictReader(f)
-        row_count = 0
         for row in reader:
-            row_count += 1
-            existing_timestamps.add(row['timestamp'])
-        
-        return row_count, existing_timestamps
+            timestamps.append(row['timestamp'])
+
+    # Rebuild the index so the next batch takes the fast path
+    with open(index_filename, 'w', encoding='utf-8') as f:
+        f.writelines(ts + '\n' for ts in timestamps)
+
+    return len(timestamps), set(timestamps)
 
-def append_to_csv(csv_filename, parsed_rows):
+def append_to_csv(csv_filename, timestamps, metrics):
     """
     Appends only new rows to the CSV, skipping any timestamps that already exist.
+    Takes the column-oriented batch produced by parse_logs.
     """
     file_exists = os.path.isfile(csv_filename)
     start_id = 0
     existing_timestamps = set()
-    
+
     if file_exists:
         start_id, existing_timestamps = load_existing_csv(csv_filename)
+        # Sessions started before the running-stats sidecar existed get
+        # seeded once from the rows already on disk
+        if TDigest is not None and _load_running_stats(csv_filename) is None:
+            _seed_running_stats(csv_filename)
+    else:
+        # Stale sidecars left over from a deleted CSV; start fresh
+        for stale in (_ts_index_path(csv_filename),
+                      _running_stats_path(csv_filename)):
+            if os.path.isfile(stale):
+                os.remove(stale)
 
     # Make sure the directory exists
     os.makedirs(os.path.dirname(os.path.abspath(csv_filename)), exist_ok=True)
 
     # Filter out rows with timestamps that already exist in the CSV
-    new_rows = [row for row in parsed_rows if row["timestamp"] not in existing_timestamps]
-    
-    if not new_rows:
+    keep = np.fromiter((ts not in existing_timestamps for ts in timestamps),
+                       dtype=bool, count=len(timestamps))
+    new_ts = [ts for ts, k in zip(timestamps, keep) if k]
+    new_metrics = metrics[keep]
+
+    if not new_ts:
         eprint("No new data points to append.")
         return 0
 
-    fieldnames = [
-        "sample_id",
-        "timestamp",
-        "fps",
-        "frames_received",
-        "frames_decoded",
-        "frames_dropped",
-        "decode_time",
-        "bitrate_received",
-        "round_trip_time",
-        "frames_received_per_second",
-        "frames_decoded_per_second"
-    ]
-
-    with open(csv_filename, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-
-        # If file didn't exist, write header
+    fieldnames = ("sample_id", "timestamp") + _METRICS
+
+    # Single C-level formatting pass over the whole batch: the %.2f-formatted
+    # metric columns are stacked with the ids and timestamps and written in
+    # one go, instead of formatting and dispatching row by row.
+    ids = np.arange(start_id, start_id + len(new_ts)).astype(str)
+    body = np.char.mod('%.2f', new_metrics)
+    table = np.column_stack([ids, np.asarray(new_ts, dtype=str), body])
+
+    # writerows drains the pre-formatted batch in one C-level loop and,
+    # unlike savetxt's printf-style '%s' pass, neither chokes on '%' in a
+    # timestamp nor lets an embedded ',' shift columns - timestamps are
+    # opaque externally supplied strings and need csv quoting.
+    # 1 MiB buffer so large batches hit the disk in a few writes instead
+    # of one syscall per 8 KiB default buffer fill
+    with open(csv_filename, 'a', newline='', encoding='utf-8',
+              buffering=1 << 20) as f:
+        writer = csv.writer(f)
         if not file_exists:
-            writer.writeheader()
-
-        # Write only new rows
-        for i, row in enumerate(new_rows):
-            out_row = {
-                "sample_id": start_id + i,
-                "timestamp": row["timestamp"],
-                "fps": f"{row['fps']:.2f}" if isinstance(row['fps'], (float, int)) and row['fps'] != 0 else "0.00",
-                "frames_received": f"{row['frames_received']:.2f}" if isinstance(row['frames_received'], (float, int)) and row['frames_received'] != 0 else "0.00",
-                "frames_decoded": f"{row['frames_decoded']:.2f}" if isinstance(row['frames_decoded'], (float, int)) and row['frames_decoded'] != 0 else "0.00",
-                "frames_dropped": f"{row['frames_dropped']:.2f}" if isinstance(row['frames_dropped'], (float, int)) and row['frames_dropped'] != 0 else "0.00",
-                "decode_time": f"{row['decode_time']:.2f}" if isinstance(row['decode_time'], (float, int)) and row['decode_time'] != 0 else "0.00",
-                "bitrate_received": f"{row['bitrate_received']:.2f}" if isinstance(row['bitrate_received'], (float, int)) and row['bitrate_received'] != 0 else "0.00",
-                "round_trip_time": f"{row['round_trip_time']:.2f}" if isinstance(row['round_trip_time'], (float, int)) and row['round_trip_time'] != 0 else "0.00",
-                "frames_received_per_second": f"{row['frames_received_per_second']:.2f}" if isinstance(row['frames_received_per_second'], (float, int)) and row['frames_received_per_second'] != 0 else "0.00",
-                "frames_decoded_per_second": f"{row['frames_decoded_per_second']:.2f}" if isinstance(row['frames_decoded_per_second'], (float, int)) and row['frames_decoded_per_second'] != 0 else "0.00"
-            }
-            writer.writerow(out_row)
-            
-    return len(new_rows)
+            writer.writerow(fieldnames)
+        writer.writerows(table)
+        f.flush()
 
-def read_all_csv_data(csv_filename):
+    # Keep the sidecars in sync with what was just appended
+    with open(_ts_index_path(csv_filename), 'a', encoding='utf-8') as f:
+        f.writelines(ts + '\n' for ts in new_ts)
+    _update_running_stats(csv_filename, new_ts, new_metrics)
+
+    return len(new_ts)
+
+def _read_all_csv_data_tolerant(csv_filename):
     """
-    Read all data from the CSV file for computing summary statistics.
+    Row-at-a-time fallback for session CSVs pandas refuses to parse -
+    e.g. a file started by an older version with a 9-column header that
+    this version then continued with full-width rows. Same column dict
+    as read_all_csv_data; fields beyond the header are ignored, like
+    csv.DictReader always did.
     """
-    if not os.path.isfile(csv_filename):
-        return []
-    
-    all_data = []
+    rows = []
     with open(csv_filename, 'r', newline='', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         for row in reader:
-            # Convert string values to float, handling potential missing columns
-            processed_row = {
-                "timestamp": row["timestamp"],
-                "fps": float(row["fps"]) if row["fps"] else 0,
-                "frames_received": float(row["frames_received"]) if row["frames_received"] else 0,
-                "frames_decoded": float(row["frames_decoded"]) if row["frames_decoded"] else 0,
-                "frames_dropped": float(row["frames_dropped"]) if row["frames_dropped"] else 0,
-                "decode_time": float(row["decode_time"]) if row["decode_time"] else 0,
-                "bitrate_received": float(row["bitrate_received"]) if row["bitrate_received"] else 0,
-                "round_trip_time": float(row["round_trip_time"]) if row["round_trip_time"] else 0
-            }
-            
-            # Handle the new columns which might not exist in older CSV files
-            processed_row["frames_received_per_second"] = float(row.get("frames_received_per_second", 0)) if row.get("frames_received_per_second") else 0
-            processed_row["frames_decoded_per_second"] = float(row.get("frames_decoded_per_second", 0)) if row.get("frames_decoded_per_second") else 0
-            
-            all_data.append(processed_row)
-    
-    return all_data
+            rows.append(row)
+
+    columns = {"timestamp": np.array([row["timestamp"] for row in rows],
+                                     dtype=object)}
+    for col in _METRICS:
+        columns[col] = np.fromiter(
+            (float(row[col]) if row.get(col) else 0.0 for row in rows),
+            dtype=np.float64, count=len(rows))
+
+    return columns
+
+def read_all_csv_data(csv_filename):
+    """
+    Read all data from the CSV file for computing summary statistics.
+    Returns a dict of columns: 'timestamp' as strings, every metric as a
+    float64 array. Columns missing from older CSV files are zero-filled.
+    """
+    if not os.path.isfile(csv_filename):
+        return {}
+
+    # Vectorized parse of the whole file; the float columns come back as
+    # float64 arrays without any per-row dict allocation
+    try:
+        df = pd.read_csv(csv_filename,
+                         dtype={col: np.float64 for col in _METRICS})
+    except (pd.errors.ParserError, pd.errors.EmptyDataError):
+        # Ragged file (rows wider than the header) or a zero-byte one
+        # (a kill before the write buffer flushed); pandas refuses both,
+        # the csv-module reader handles them
+        return _read_all_csv_data_tolerant(csv_filename)
+
+    columns = {"timestamp": df["timestamp"].to_numpy()}
+    for col in _METRICS:
+        if col in df.columns:
+            # Empty cells parse as NaN; treat them as 0 like float('') did
+            columns[col] = np.nan_to_num(df[col].to_numpy(dtype=np.float64))
+        else:
+            columns[col] = np.zeros(len(df))
+
+    return columns
 
 def calculate_percentiles(values):
     """
-    Calculate percentiles for a list of values.
+    Calculate percentiles for an array of values.
     Returns p50, p75, p99, and p99.9 percentiles.
     """
-    if not values:
+    if len(values) == 0:
         return {
             "p50": 0,
             "p75": 0,
             "p99": 0,
             "p99_9": 0
         }
-    
-    values = np.array(values)
+
+    # One percentile call sorts the array once for all four quantiles
+    p50, p75, p99, p99_9 = np.percentile(values, [50, 25, 1, 0.1])
     return {
-        "p50": float(np.percentile(values, 50)),
-        "1-p75": float(np.percentile(values, 25)),
-        "1-p99": float(np.percentile(values, 1)),
-        "1-p99_9": float(np.percentile(values, 0.1))
+        "p50": float(p50),
+        "1-p75": float(p75),
+        "1-p99": float(p99),
+        "1-p99_9": float(p99_9)
     }
 
 def compute_summary(csv_filename):
     """
     Produces a comprehensive summary with mean, std, and percentiles.
-    Now reads all data from the CSV file to compute summary across the entire session.
+    Uses the running statistics maintained by append_to_csv, so each batch
+    does O(batch) work; mean/std/min/max are exact and percentiles come
+    from the per-metric t-digest. Falls back to re-reading the whole CSV
+    when the sidecar is unavailable (e.g. tdigest not installed).
+    """
+    running = _load_running_stats(csv_filename) if TDigest is not None else None
+    if running is None or not running.get("num_samples"):
+        return _compute_summary_from_csv(csv_filename)
+
+    summary = {
+        "num_samples": running["num_samples"],
+        "first_timestamp": running["first_timestamp"],
+        "latest_timestamp": running["latest_timestamp"]
+    }
+
+    for metric, m in running["metrics"].items():
+        n = m["count"]
+        if n == 0:
+            continue
+        mean = m["sum"] / n
+        # Sample std recovered from the running sums (clamped for the
+        # tiny negative values floating-point cancellation can produce)
+        var = max((m["sum_sq"] - m["sum"] * m["sum"] / n) / (n - 1), 0.0) if n > 1 else 0.0
+        digest = TDigest()
+        digest.update_from_dict(m["digest"])
+
+        # Rounded to 2 decimals here; the summary is emitted as-is
+        summary[metric] = {
+            "mean": round(mean, 2),
+            "std": round(var ** 0.5, 2),
+            "min": round(m["min"], 2),
+            "max": round(m["max"], 2),
+            "count": n,
+            "p50": round(digest.percentile(50), 2),
+            "1-p75": round(digest.percentile(25), 2),
+            "1-p99": round(digest.percentile(1), 2),
+            "1-p99_9": round(digest.percentile(0.1), 2)
+        }
+
+    return summary
+
+def _compute_summary_from_csv(csv_filename):
+    """
+    Full recomputation of the summary from the session CSV. Used when the
+    running-stats sidecar can't be maintained (exact percentiles, but
+    every batch pays the full re-read).
     """
     # Read all data from CSV
-    all_rows = read_all_csv_data(csv_filename)
-    
-    if not all_rows:
+    columns = read_all_csv_data(csv_filename)
+    timestamps = columns.get("timestamp", [])
+
+    if len(timestamps) == 0:
         return {
             "num_samples": 0,
             "error": "No data available for summary"
         }
-    
-    # Initialize metrics to track
-    metrics = [
-        "fps", "frames_received", "frames_decoded", "frames_dropped", 
-        "decode_time", "bitrate_received", "round_trip_time",
-        "frames_received_per_second", "frames_decoded_per_second"
-    ]
-    
+
     # Initialize results dictionary
     summary = {
-        "num_samples": len(all_rows)
+        "num_samples": len(timestamps)
     }
-    
+
     # Add timestamp range
-    if all_rows:
-        summary["first_timestamp"] = all_rows[0]["timestamp"]
-        summary["latest_timestamp"] = all_rows[-1]["timestamp"]
-    
+    summary["first_timestamp"] = timestamps[0]
+    summary["latest_timestamp"] = timestamps[-1]
+
     # Process each metric
-    for metric in metrics:
-        # Extract non-zero values for this metric
-        values = [row[metric] for row in all_rows if row[metric] > 0]
-        
-        if not values:
+    for metric in _METRICS:
+        # Extract non-zero values for this metric, shared by the basic
+        # statistics and the percentile calculation
+        arr = columns[metric]
+        values = arr[arr > 0]
+
+        if len(values) == 0:
             continue  # Skip metrics with no valid data
         
-        # Calculate basic statistics
+        # Calculate basic statistics (all C-level reductions on the array),
+        # rounded to the 2 decimals the summary is emitted with
         metric_stats = {
-            "mean": float(mean(values)),
-            "std": float(stdev(values)) if len(values) > 1 else 0,
-            "min": float(min(values)),
-            "max": float(max(values)),
+            "mean": round(float(values.mean()), 2),
+            "std": round(float(values.std(ddof=1)), 2) if len(values) > 1 else 0,
+            "min": round(float(values.min()), 2),
+            "max": round(float(values.max()), 2),
             "count": len(values)
         }
-        
+
         # Add percentiles
         percentiles = calculate_percentiles(values)
-        metric_stats.update(percentiles)
+        metric_stats.update({key: round(val, 2) for key, val in percentiles.items()})
         
         # Add to summary
         summary[metric] = metric_stats
@@ -412,10 +655,17 @@ def main():
     eprint(f"Using CSV output path: {csv_filename}")
     eprint(f"Using Summary output path: {summary_filename}")
 
-    # Load data from JSON
+    # Load data from JSON (orjson parses large stats dumps ~3x faster).
+    # The file is memory-mapped so orjson reads it zero-copy instead of
+    # going through a full buffered read; the stdlib parser still needs
+    # a bytes object.
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if orjson is not None:
+                    data = orjson.loads(memoryview(mm))
+                else:
+                    data = json.loads(mm[:])
     except Exception as e:
         eprint(f"Error reading JSON: {e}")
         print(json.dumps({"error": "Could not read JSON file"}))
@@ -428,28 +678,41 @@ def main():
         sys.exit(1)
 
     # Parse the logs from this batch
-    parsed_rows = parse_logs(data)
-    eprint(f"Parsed {len(parsed_rows)} unique data points from current batch")
+    timestamps, metrics = parse_logs(data)
+    eprint(f"Parsed {len(timestamps)} unique data points from current batch")
 
     # Append only new rows to CSV
-    rows_appended = append_to_csv(csv_filename, parsed_rows)
+    rows_appended = append_to_csv(csv_filename, timestamps, metrics)
     eprint(f"Appended {rows_appended} new rows to CSV")
 
-    # Compute summary using all data in the CSV
-    summary_data = compute_summary(csv_filename)
-    
-    # Make sure the directory exists for the summary file
-    os.makedirs(os.path.dirname(os.path.abspath(summary_filename)), exist_ok=True)
-    
-    # Format values to 2 decimal places for readability
-    for metric, stats in summary_data.items():
-        if isinstance(stats, dict):
-            for stat_key, value in stats.items():
-                if isinstance(value, (float, int)) and stat_key not in ["count", "num_samples"]:
-                    stats[stat_key] = round(value, 2)
-    
-    with open(summary_filename, 'w', encoding='utf-8') as sf:
-        json.dump(summary_data, sf, indent=2)
+    summary_data = None
+    if rows_appended == 0 and os.path.isfile(summary_filename):
+        # Nothing new this batch; the summary on disk is still current
+        try:
+            with open(summary_filename, 'r', encoding='utf-8') as sf:
+                summary_data = json.load(sf)
+        except (ValueError, OSError):
+            # Truncated/corrupt summary (the write isn't atomic);
+            # recompute and overwrite it like any other batch
+            summary_data = None
+
+    if summary_data is None:
+        # Compute summary using all data in the CSV (values arrive already
+        # rounded to 2 decimal places for readability)
+        summary_data = compute_summary(csv_filename)
+
+        # Make sure the directory exists for the summary file
+        os.makedirs(os.path.dirname(os.path.abspath(summary_filename)), exist_ok=True)
+
+        if orjson is not None:
+            # OPT_SERIALIZE_NUMPY lets any numpy scalars through natively
+            with open(summary_filename, 'wb') as sf:
+                sf.write(orjson.dumps(
+                    summary_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(summary_filename, 'w', encoding='utf-8') as sf:
+                json.dump(summary_data, sf, indent=2)
 
     # Print a minimal JSON to stdout for Node.js to parse
     print(json.dumps({